@@ -1,64 +1,147 @@
-from abc import ABC, abstractmethod
+import hashlib
+import inspect
+import logging
+import sys
+import warnings
+from array import array
+from decimal import Decimal
+
+# NumPy/Numba are only needed for the batch paths (execute_batch)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import jit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def jit(*args, **kwargs):
+        """Fallback when Numba is missing: run the kernel as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# ====================================================
+# 0. Output Sink (straight into stdout's buffer, flushed once per transaction)
+# ====================================================
+# The "banking" logger is the on/off switch: lines are only written while it
+# is enabled for INFO (logger.setLevel(logging.WARNING) silences them). They
+# skip the Logger.info/LogRecord/Handler machinery, which cost several
+# microseconds per line, and go straight into sys.stdout's own buffer, looked
+# up per call so redirect_stdout() and test capture still apply.
+logger = logging.getLogger("banking")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+def _log(message):
+    """Hot-path sink: one write into sys.stdout's buffer."""
+    sys.stdout.write(message + "\n")
+
+def flush_log():
+    """Pushes any buffered output to the OS."""
+    sys.stdout.flush()
+
+# ====================================================
+# Money: int cents internally, dollars (float/Decimal in, float/Decimal out) at the API
+# ====================================================
+def _to_cents(amount):
+    """Converts a dollar amount (int, float or Decimal) to int cents."""
+    return int(round(amount * 100))
+
+def _money(cents):
+    """Formats int cents as "$D.CC", shared by every log line and notification."""
+    if cents < 0:
+        return f"$-{-cents // 100}.{-cents % 100:02d}"
+    return f"${cents // 100}.{cents % 100:02d}"
 
 # ====================================================
 # 1. Base Account (Abstraction, Encapsulation, Subject)
 # ====================================================
-class BaseAccount(ABC):
+class BaseAccount:
+    __slots__ = ("_account_number", "_balance", "_observers", "_update_fns", "_pending")
+
     def __init__(self, account_number, initial_balance=0):
         self._account_number = account_number
-        self._balance = initial_balance
-        self._observers = [] # Observer list
+        self._balance = _to_cents(initial_balance) # int cents
+        self._observers = {} # Observer set (dict keys keep attach order)
+        self._update_fns = () # Cached bound observer.update methods
+        self._pending = None # Shared queue while notifications are deferred
 
     # --- Observer Management Methods (Subject role) ---
     def attach(self, observer):
-        """Adds an observer (Customer) to the list."""
-        if observer not in self._observers:
-            self._observers.append(observer)
+        """Adds an observer (Customer) to the set."""
+        self._observers[observer] = None
+        self._update_fns = tuple(o.update for o in self._observers)
 
     def detach(self, observer):
-        """Removes an observer from the list."""
-        try:
-            self._observers.remove(observer)
-        except ValueError:
-            pass
+        """Removes an observer from the set, if present."""
+        # Unsubscribing an unknown observer is a no-op: no exception, no rebuild
+        if observer in self._observers:
+            del self._observers[observer]
+            self._update_fns = tuple(o.update for o in self._observers)
 
     def _notify_observers(self, message):
-        """Notifies all attached observers."""
-        for observer in self._observers:
-            observer.update(message)
+        """Notifies all attached observers (or queues them while deferred)."""
+        if self._pending is not None:
+            self._pending.append((self._update_fns, message))
+            return
+        for fn in self._update_fns:
+            fn(message)
 
     # --- Core banking methods (Trigger notifications) ---
     def deposit(self, amount):
+        return self._deposit_cents(_to_cents(amount))
+
+    def withdraw(self, amount):
+        return self._withdraw_cents(_to_cents(amount))
+
+    def _deposit_cents(self, amount):
         if amount > 0:
             self._balance += amount
-            print(f"Deposit successful. New balance: ${self._balance:.2f}")
-            self._notify_observers(f"Deposit of ${amount:.2f} made.")
+            if logger.isEnabledFor(logging.INFO):
+                _log("Deposit successful. New balance: " + _money(self._balance))
+            if self._update_fns:
+                self._notify_observers("Deposit of " + _money(amount) + " made.")
             return True
         return False
 
-    def withdraw(self, amount):
+    def _withdraw_cents(self, amount):
         # NOTE: Concrete accounts can override this for specific rules (e.g., minimum balance)
         if amount > 0 and self._balance >= amount:
             self._balance -= amount
-            print(f"Withdrawal successful. New balance: ${self._balance:.2f}")
-            self._notify_observers(f"Withdrawal of ${amount:.2f} made.")
+            if logger.isEnabledFor(logging.INFO):
+                _log("Withdrawal successful. New balance: " + _money(self._balance))
+            if self._update_fns:
+                self._notify_observers("Withdrawal of " + _money(amount) + " made.")
             return True
-        print("Error: Insufficient funds or invalid amount.")
+        if logger.isEnabledFor(logging.INFO):
+            _log("Error: Insufficient funds or invalid amount.")
         return False
     
-    # Simple getter method (used by strategies)
+    # Simple getter method (used by strategies); float dollars as before
     def get_balance(self):
+        return self._balance / 100
+
+    # Exact forms: Decimal dollars, and the int cents the built-in strategies use
+    def get_balance_decimal(self):
+        return Decimal(self._balance).scaleb(-2)
+
+    def get_balance_cents(self):
         return self._balance
     
-    # Abstract method for Strategy Pattern
-    @abstractmethod
+    # Abstract method for Strategy Pattern (plain base class, no ABCMeta)
     def calculate_interest(self):
-        pass
+        raise NotImplementedError
 
 # ====================================================
 # 2. Concrete Accounts (Inheritance & Strategy Context)
 # ====================================================
 class SavingsAccount(BaseAccount):
+    __slots__ = ("interest_strategy",)
+
     def __init__(self, account_number, initial_balance=0, interest_strategy=None):
         super().__init__(account_number, initial_balance)
         self.interest_strategy = interest_strategy # Strategy Composition
@@ -69,6 +152,8 @@ class SavingsAccount(BaseAccount):
             self.interest_strategy.calculate(self)
 
 class CurrentAccount(BaseAccount):
+    __slots__ = ("interest_strategy",)
+
     def __init__(self, account_number, initial_balance=0, interest_strategy=None):
         super().__init__(account_number, initial_balance)
         self.interest_strategy = interest_strategy
@@ -81,100 +166,483 @@ class CurrentAccount(BaseAccount):
 # 3. Customer Class (Concrete Observer)
 # ====================================================
 class Customer:
+    __slots__ = ("_name", "_prefix")
+
     def __init__(self, name):
         self.name = name
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        # Built once per name so update() only has to concatenate
+        self._prefix = sys.intern(f"[Customer {name} Notification]: Your account activity: ")
+
     def update(self, message):
         """This is the method called by the Subject (Account)."""
-        print(f"[Customer {self.name} Notification]: Your account activity: {message}")
+        if logger.isEnabledFor(logging.INFO):
+            _log(self._prefix + message)
 
 # ====================================================
 # 4. Strategy Pattern (Interest Calculation)
 # ====================================================
-class InterestStrategy(ABC):
+# Rate table indexed by strategy type code (0 = savings, 1 = current).
+# Rates are in basis points and interest is floored to whole cents; it is
+# only paid on balances strictly above the threshold (in cents).
+SAVINGS_INTEREST, CURRENT_INTEREST = 0, 1
+INTEREST_RATES_BP = (300, 50)
+INTEREST_THRESHOLDS = (0, 50000)
+if np is not None:
+    RATES = np.array(INTEREST_RATES_BP, dtype=np.int64)
+    THRESH = np.array(INTEREST_THRESHOLDS, dtype=np.int64)
+
+def _interest_cents(balance, type_code):
+    if balance > INTEREST_THRESHOLDS[type_code]:
+        return balance * INTEREST_RATES_BP[type_code] // 10000
+    return 0
+
+def apply_interest(balances, types):
+    """Vector path: adds interest to an int64 balances array (cents) in place.
+
+    types is an int8 array of strategy type codes parallel to balances (or a
+    single code for all of them). Returns the interest paid per balance.
+    Float (dollar) arrays are rejected rather than silently floored as cents.
+    """
+    if not np.issubdtype(balances.dtype, np.integer):
+        raise TypeError(f"apply_interest expects integer cents, got {balances.dtype} balances")
+    types = np.asarray(types)
+    if types.ndim == 0:
+        types = np.full(balances.shape, types, dtype=np.int8)
+    # The kernels do no bounds checking, so validate before handing them arrays
+    if types.shape != balances.shape:
+        raise ValueError("types must be a single code or match the shape of balances")
+    if types.size and (types.min() < 0 or types.max() >= len(INTEREST_RATES_BP)):
+        raise IndexError("apply_interest: unknown interest type code")
+    if _apply_interest is not None and balances.dtype == np.int64 and balances.ndim == 1:
+        return _apply_interest(balances, types.astype(np.int8, copy=False), RATES, THRESH)
+    interest = np.where(balances > THRESH[types], balances * RATES[types] // 10000, 0)
+    balances += interest
+    return interest
+
+class InterestStrategy:
     """Strategy Interface: Defines the common method."""
-    @abstractmethod
+    type_code = None
+
     def calculate(self, account):
-        pass
+        raise NotImplementedError
 
 class SavingsInterest(InterestStrategy):
     """Concrete Strategy 1: Savings rate."""
+    type_code = SAVINGS_INTEREST
+
     def calculate(self, account):
-        rate = 0.03 # 3%
-        interest = account.get_balance() * rate
+        if np is not None and isinstance(account, np.ndarray):
+            return apply_interest(account, self.type_code)
+        interest = _interest_cents(account.get_balance_cents(), SAVINGS_INTEREST)
         # Use deposit() which updates balance and triggers the Observer notification
-        account.deposit(interest) 
-        print(f"SAVINGS Interest Calculated: ${interest:.2f} (3%)")
+        account._deposit_cents(interest)
+        if logger.isEnabledFor(logging.INFO):
+            _log("SAVINGS Interest Calculated: " + _money(interest) + " (3%)")
 
 class CurrentInterest(InterestStrategy):
     """Concrete Strategy 2: Low Current rate."""
+    type_code = CURRENT_INTEREST
+
     def calculate(self, account):
-        rate = 0.005 # 0.5%
-        if account.get_balance() > 500:
-            interest = account.get_balance() * rate
-            account.deposit(interest)
-            print(f"CURRENT Interest Calculated: ${interest:.2f} (0.5%)")
+        if np is not None and isinstance(account, np.ndarray):
+            return apply_interest(account, self.type_code)
+        if account.get_balance_cents() > INTEREST_THRESHOLDS[CURRENT_INTEREST]:
+            interest = _interest_cents(account.get_balance_cents(), CURRENT_INTEREST)
+            account._deposit_cents(interest)
+            if logger.isEnabledFor(logging.INFO):
+                _log("CURRENT Interest Calculated: " + _money(interest) + " (0.5%)")
         else:
-            print("CURRENT Interest: Balance too low to earn interest.")
+            if logger.isEnabledFor(logging.INFO):
+                _log("CURRENT Interest: Balance too low to earn interest.")
+
+def calculate_interest_batch(accounts):
+    """Runs an interest period over many accounts with one vectorized pass.
+
+    Accounts without an interest strategy are left untouched. Strategies
+    without a type_code (user-defined ones) can't join the vector pass and
+    go through account.calculate_interest() instead. Observers are notified
+    afterwards for every account that earned interest.
+    Returns the interest paid per account in cents, in the order given.
+    """
+    if np is None:
+        raise ImportError("calculate_interest_batch requires NumPy")
+    pos, custom = [], []
+    for i, account in enumerate(accounts):
+        strategy = getattr(account, "interest_strategy", None)
+        if strategy is not None:
+            (custom if getattr(strategy, "type_code", None) is None else pos).append(i)
+    balances = np.fromiter((accounts[i]._balance for i in pos), dtype=np.int64, count=len(pos))
+    types = np.fromiter((accounts[i].interest_strategy.type_code for i in pos), dtype=np.int8, count=len(pos))
+
+    interest = np.zeros(len(accounts), dtype=np.int64)
+    interest[pos] = apply_interest(balances, types)
+
+    paid = interest.tolist()
+    for i, balance in zip(pos, balances.tolist()):
+        account = accounts[i]
+        account._balance = balance
+        if paid[i] > 0 and account._observers:
+            account._notify_observers("Deposit of " + _money(paid[i]) + " made.")
+    for i in custom:
+        account = accounts[i]
+        before = account._balance
+        account.calculate_interest()
+        interest[i] = account._balance - before
+    flush_log()
+    return interest
 
 # ====================================================
 # 5. Command Pattern (Transactions & Undo)
 # ====================================================
-class Command(ABC):
-    """Command Interface: Contract for execute and undo."""
-    @abstractmethod
+# Opcodes used by the transaction history and the batch kernels.
+# OP_CUSTOM marks a history entry that holds a user-defined Command object.
+OP_DEPOSIT, OP_WITHDRAW, OP_CUSTOM = 0, 1, -1
+
+class Command:
+    """Command Interface: Contract for execute and undo.
+
+    Built-in commands set opcode and keep _account/_amount so the manager
+    can store them as plain columns; subclasses that leave opcode as None
+    are kept in the history as objects and undone through undo().
+    """
+    __slots__ = ()
+    opcode = None
+
     def execute(self):
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def undo(self):
-        pass
+        raise NotImplementedError
+
+    # --- Object pool (each concrete command class owns its _pool list) ---
+    # _pooled is None for caller-owned commands, False while acquired and
+    # True while sitting in the pool.
+    @classmethod
+    def acquire(cls, account, amount):
+        """Returns a pooled command bound to account/amount, or a new one."""
+        if cls._pool:
+            command = cls._pool.pop()
+            command._account = account
+            command._amount = amount
+        else:
+            command = cls(account, amount)
+        command._pooled = False
+        return command
+
+    def release(self):
+        """Returns an acquire()d command to its class pool.
+
+        Commands built directly by the caller, or already released, are
+        rejected so the pool never hands out the same object twice.
+        """
+        if self._pooled is not False:
+            raise ValueError("only commands obtained from acquire() can be released, once")
+        self._account = None
+        self._pooled = True
+        type(self)._pool.append(self)
 
 class DepositCommand(Command):
     """Concrete Command: Encapsulates Deposit request."""
+    __slots__ = ("_account", "_amount", "_pooled")
+    _pool = []
+    opcode = OP_DEPOSIT
+
     def __init__(self, account: BaseAccount, amount: float):
         self._account = account
         self._amount = amount
+        self._pooled = None # Caller-owned; never enters the pool
 
     def execute(self):
         return self._account.deposit(self._amount) # Receiver performs the action
 
     def undo(self):
-        print(f"[Undoing Command] Reversing Deposit of ${self._amount:.2f}...")
+        if logger.isEnabledFor(logging.INFO):
+            _log("[Undoing Command] Reversing Deposit of " + _money(_to_cents(self._amount)) + "...")
         return self._account.withdraw(self._amount) # To undo a deposit, withdraw
 
 class WithdrawCommand(Command):
     """Concrete Command: Encapsulates Withdrawal request."""
+    __slots__ = ("_account", "_amount", "_pooled")
+    _pool = []
+    opcode = OP_WITHDRAW
+
     def __init__(self, account: BaseAccount, amount: float):
         self._account = account
         self._amount = amount
+        self._pooled = None # Caller-owned; never enters the pool
 
     def execute(self):
         return self._account.withdraw(self._amount)
 
     def undo(self):
-        print(f"[Undoing Command] Reversing Withdrawal of ${self._amount:.2f}...")
+        if logger.isEnabledFor(logging.INFO):
+            _log("[Undoing Command] Reversing Withdrawal of " + _money(_to_cents(self._amount)) + "...")
         return self._account.deposit(self._amount) # To undo a withdrawal, deposit
 
+# Pre-warm the command pools. Since history is stored as opcode columns, the
+# only pool user is undo_last_transaction, which holds one command at a time;
+# a few spares cover undos triggered re-entrantly from observer callbacks.
+COMMAND_POOL_SIZE = 4
+for _cls in (DepositCommand, WithdrawCommand):
+    for _ in range(COMMAND_POOL_SIZE):
+        _command = _cls(None, 0.0)
+        _command._pooled = True
+        _cls._pool.append(_command)
+del _cls, _command
+
+_COMMAND_FOR_OP = (DepositCommand, WithdrawCommand) # Indexed by opcode
+
 # Invoker: Maintains history and executes commands
 class TransactionManager:
-    def __init__(self):
-        self._history = [] # Stores executed commands for undo
+    __slots__ = ("_ops", "_amts", "_accts", "_start", "_max_history")
+
+    def __init__(self, max_history=1024):
+        # History stored as parallel (opcode, amount, account) columns for undo.
+        # Entries before _start have fallen out of the max_history window.
+        # max_history=None keeps an unbounded history, like deque(maxlen=None).
+        if max_history is not None and max_history < 0:
+            raise ValueError("max_history must be None or a non-negative integer")
+        self._ops = array('b')
+        self._amts = array('d')
+        self._accts = [] # Account, or the command itself for OP_CUSTOM entries
+        self._start = 0
+        self._max_history = max_history
+
+    def _record(self, op, account, amount):
+        self._ops.append(op)
+        self._amts.append(amount)
+        self._accts.append(account)
+        if self._max_history is not None and len(self._ops) - self._start > self._max_history:
+            self._start += 1
+            # Compact once the dead prefix is as large as the window itself
+            if self._start >= self._max_history:
+                del self._ops[:self._start], self._amts[:self._start], self._accts[:self._start]
+                self._start = 0
+
+    def _run(self, command):
+        """Executes a command and records it for undo if it succeeds."""
+        # Read the history entry up front so a command that can't be recorded
+        # fails before it touches any balance
+        op = getattr(command, "opcode", None)
+        if op is None:
+            entry = (OP_CUSTOM, command, 0.0)
+        else:
+            entry = (op, command._account, command._amount)
+        done = command.execute()
+        if done:
+            self._record(*entry)
+        return done
 
     def execute_transaction(self, command: Command):
-        print("\n--- Transaction Start ---")
-        if command.execute():
-            self._history.append(command)
-            return True
-        return False
+        if logger.isEnabledFor(logging.INFO):
+            _log("\n--- Transaction Start ---")
+        try:
+            return bool(self._run(command))
+        finally:
+            flush_log() # One flush per transaction
+
+    def execute_many(self, commands):
+        """Executes commands as one group: balances first, notifications after.
+
+        Observer notifications raised while the commands run are queued and
+        delivered in their original order once every balance update is done.
+        If a command raises, the notifications for the commands already
+        applied are still delivered before the exception propagates.
+        Returns a list of per-command results.
+        """
+        commands = list(commands)
+        # Only built-in commands expose their account for deferred notification
+        accounts = {c._account: None for c in commands if getattr(c, "opcode", None) is not None}
+        pending = []
+        if logger.isEnabledFor(logging.INFO):
+            _log(f"\n--- Batch Start ({len(commands)} transactions) ---")
+        for account in accounts:
+            account._pending = pending
+        results = []
+        try:
+            for command in commands:
+                results.append(self._run(command))
+        finally:
+            for account in accounts:
+                account._pending = None
+            try:
+                for fns, message in pending:
+                    for fn in fns:
+                        fn(message)
+            finally:
+                flush_log()
+        return results
+
+    def execute_op(self, op, account, amount):
+        """Opcode form of execute_transaction (OP_DEPOSIT or OP_WITHDRAW)."""
+        if logger.isEnabledFor(logging.INFO):
+            _log("\n--- Transaction Start ---")
+        try:
+            done = account.deposit(amount) if op == OP_DEPOSIT else account.withdraw(amount)
+            if done:
+                self._record(op, account, amount)
+            return done
+        finally:
+            flush_log()
 
     def undo_last_transaction(self):
-        if not self._history:
-            print("\nError: No transactions to undo.")
+        if len(self._ops) == self._start:
+            if logger.isEnabledFor(logging.INFO):
+                _log("\nError: No transactions to undo.")
             return False
         
-        last_command = self._history.pop()
-        print("\n--- UNDO Start ---")
-        last_command.undo()
-        print("Successfully undone the last transaction.")
+        op, amount, account = self._ops.pop(), self._amts.pop(), self._accts.pop()
+        if logger.isEnabledFor(logging.INFO):
+            _log("\n--- UNDO Start ---")
+        if op == OP_CUSTOM:
+            account.undo() # The entry holds the command object itself
+        else:
+            last_command = _COMMAND_FOR_OP[op].acquire(account, amount)
+            last_command.undo()
+            last_command.release()
+        if logger.isEnabledFor(logging.INFO):
+            _log("Successfully undone the last transaction.")
         return True
+
+    def execute_batch(self, accounts, idx, amount, ops):
+        """Applies many deposits/withdrawals in one pass over a balance array.
+
+        Record i applies opcode ops[i] (OP_DEPOSIT/OP_WITHDRAW) for amount[i]
+        dollars to accounts[idx[i]]. Records follow the same rules as deposit()/
+        withdraw() and are skipped otherwise. The same account may appear in
+        accounts more than once. Observers are notified in a second pass.
+        Batched records are not added to the undo history.
+        Returns a boolean array marking which records were applied.
+        """
+        if np is None:
+            raise ImportError("execute_batch requires NumPy")
+        idx = np.ascontiguousarray(idx, dtype=np.int64)
+        amount = np.rint(np.asarray(amount, dtype=np.float64) * 100).astype(np.int64) # cents
+        ops = np.ascontiguousarray(ops, dtype=np.int8)
+        # The kernels do no bounds checking, so validate before handing them arrays
+        if not idx.ndim == amount.ndim == ops.ndim == 1 or not idx.shape == amount.shape == ops.shape:
+            raise ValueError("idx, amount and ops must be 1-D arrays of the same length")
+        n = len(accounts)
+        if idx.size and (idx.min() < -n or idx.max() >= n):
+            raise IndexError("execute_batch: account index out of range")
+        if ops.size and (ops.min() < OP_DEPOSIT or ops.max() > OP_WITHDRAW):
+            raise ValueError("ops must only contain OP_DEPOSIT or OP_WITHDRAW")
+        if idx.size and idx.min() < 0:
+            idx = np.where(idx < 0, idx + n, idx)
+        # One balance slot per distinct account, or repeated entries would
+        # overwrite each other on write-back
+        slots = {}
+        slot_of = [slots.setdefault(a, len(slots)) for a in accounts]
+        if len(slots) < n:
+            idx = np.array(slot_of, dtype=np.int64)[idx]
+        accounts = list(slots)
+        balances = np.fromiter((a._balance for a in accounts), dtype=np.int64, count=len(accounts))
+
+        applied = _apply_batch(balances, idx, amount, ops)
+
+        for account, balance in zip(accounts, balances.tolist()):
+            account._balance = balance
+        # Notification pass: only touches accounts that have observers
+        for i in np.flatnonzero(applied).tolist():
+            account = accounts[idx[i]]
+            if account._observers:
+                kind = "Deposit" if ops[i] == OP_DEPOSIT else "Withdrawal"
+                account._notify_observers(kind + " of " + _money(int(amount[i])) + " made.")
+        if logger.isEnabledFor(logging.INFO):
+            _log(f"Batch applied: {int(applied.sum())}/{len(applied)} transactions.")
+        flush_log()
+        return applied
+
+# ====================================================
+# 6. Batch Kernels (NumPy arrays, compiled with Numba when available)
+# ====================================================
+@jit(nopython=True, cache=True)
+def _apply_op(balance, op, amt):
+    """Returns the balance after applying a single opcode."""
+    return balance + amt if op == OP_DEPOSIT else balance - amt
+
+@jit(nopython=True, cache=True)
+def _jit_apply_batch(balances, idx, amount, ops):
+    """Applies (idx, amount, op) records to the balances array in order."""
+    n = idx.shape[0]
+    applied = np.zeros(n, dtype=np.bool_)
+    # Sequential on purpose: records may hit the same account, and withdrawals
+    # depend on the balance left by earlier records
+    for i in range(n):
+        j = idx[i]
+        amt = amount[i]
+        if amt <= 0:
+            continue
+        if ops[i] == OP_DEPOSIT or balances[j] >= amt:
+            balances[j] = _apply_op(balances[j], ops[i], amt)
+            applied[i] = True
+    return applied
+
+@jit(nopython=True, cache=True)
+def _jit_apply_interest(balances, types, rates, thresh):
+    """Adds interest to balances in place; returns the interest per balance."""
+    interest = np.zeros(balances.shape[0], dtype=np.int64)
+    for i in range(balances.shape[0]):
+        t = types[i]
+        if balances[i] > thresh[t]:
+            interest[i] = balances[i] * rates[t] // 10000
+            balances[i] += interest[i]
+    return interest
+
+# Kernels exported by compile_kernels.py, with their fixed AOT signatures
+AOT_EXPORTS = {
+    "apply_batch": (_jit_apply_batch, "b1[:](i8[:], i8[:], i8[:], i1[:])"),
+    "apply_interest": (_jit_apply_interest, "i8[:](i8[:], i1[:], i8[:], i8[:])"),
+}
+
+def kernel_abi():
+    """Fingerprint of the kernel sources, signatures and opcodes.
+
+    compile_kernels.py bakes this into banking_kernels, so a build made from
+    older kernels is detected at import instead of returning wrong results.
+    Returns None when the sources aren't available (e.g. .pyc-only installs).
+    """
+    funcs = [_apply_op] + [fn for fn, _ in AOT_EXPORTS.values()]
+    try:
+        parts = [inspect.getsource(getattr(fn, "py_func", fn)) for fn in funcs]
+    except (OSError, TypeError):
+        return None
+    parts += [f"{name}:{sig}" for name, (_, sig) in AOT_EXPORTS.items()]
+    parts.append(repr((OP_DEPOSIT, OP_WITHDRAW)))
+    digest = hashlib.sha256("\n".join(parts).encode()).digest()
+    return int.from_bytes(digest[:7], "little") # Fits the exported i8
+
+def _aot_kernels(module):
+    """Returns (apply_batch, apply_interest) from an AOT build, or None if stale."""
+    expected = kernel_abi()
+    try:
+        built = module.kernel_abi()
+    except AttributeError:
+        built = None
+    if expected is None or built != expected:
+        warnings.warn("banking_kernels was built from different kernels; rerun "
+                      "compile_kernels.py. Falling back to the JIT kernels.", RuntimeWarning)
+        return None
+    return module.apply_batch, module.apply_interest
+
+# Prefer the ahead-of-time build (python compile_kernels.py) so start-up pays
+# no JIT compile; otherwise fall back to the jitted kernels. Without Numba the
+# interest path stays on NumPy (apply_interest) instead of a Python loop.
+try:
+    import banking_kernels
+except ImportError:
+    banking_kernels = None
+_aot = _aot_kernels(banking_kernels) if banking_kernels is not None else None
+if _aot is not None:
+    _apply_batch, _apply_interest = _aot
+else:
+    _apply_batch = _jit_apply_batch
+    _apply_interest = _jit_apply_interest if HAVE_NUMBA else None
@@ -0,0 +1,35 @@
+"""Ahead-of-time build of the banking batch kernels.
+
+Run once (e.g. at install time) to produce the banking_kernels extension
+module next to banking_core.py:
+
+    python compile_kernels.py
+
+banking_core imports banking_kernels when it exists, so processes skip the
+Numba JIT warm-up entirely; otherwise it falls back to the jitted kernels.
+The build records banking_core.kernel_abi(), and a build from older kernels
+is ignored (with a warning) until it is recompiled.
+"""
+import os
+
+from numba.pycc import CC
+
+from banking_core import AOT_EXPORTS, kernel_abi
+
+cc = CC("banking_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same Python source as the JIT kernels, compiled for fixed signatures
+for _name, (_kernel, _signature) in AOT_EXPORTS.items():
+    cc.export(_name, _signature)(_kernel.py_func)
+
+KERNEL_ABI = kernel_abi()
+if KERNEL_ABI is None:
+    raise RuntimeError("banking_core kernel sources are unavailable; cannot build")
+
+@cc.export("kernel_abi", "i8()")
+def _kernel_abi():
+    return KERNEL_ABI
+
+if __name__ == "__main__":
+    cc.compile()
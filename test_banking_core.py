@@ -0,0 +1,341 @@
+import contextlib
+import io
+import types
+import unittest
+
+import banking_core
+from banking_core import (
+    OP_DEPOSIT, OP_WITHDRAW, Command, CurrentAccount, CurrentInterest, DepositCommand,
+    Customer, InterestStrategy,
+    SavingsAccount, SavingsInterest, TransactionManager, WithdrawCommand,
+    apply_interest, calculate_interest_batch, np,
+)
+
+
+class RecordingObserver:
+    def __init__(self):
+        self.messages = []
+
+    def update(self, message):
+        self.messages.append(message)
+
+
+class BankingTestCase(unittest.TestCase):
+    def setUp(self):
+        # Keep the banking log output out of the test run
+        self.output = io.StringIO()
+        redirect = contextlib.redirect_stdout(self.output)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+
+
+# Mix of repeated accounts, overdrafts and non-positive amounts
+RECORDS = [
+    (0, 25.50, OP_DEPOSIT), (1, 100.0, OP_WITHDRAW), (1, 5.25, OP_WITHDRAW),
+    (2, 0.0, OP_DEPOSIT), (0, 200.0, OP_WITHDRAW), (0, 125.50, OP_WITHDRAW),
+    (2, -3.0, OP_DEPOSIT), (2, 7.77, OP_DEPOSIT), (1, 4.75, OP_WITHDRAW),
+]
+
+
+def make_accounts():
+    return [SavingsAccount("S1", 100.0), CurrentAccount("C1", 10.0), SavingsAccount("S2", 0)]
+
+
+@unittest.skipIf(np is None, "batch paths need NumPy")
+class ExecuteBatchTest(BankingTestCase):
+    def test_matches_deposit_withdraw_loop(self):
+        expected_accounts = make_accounts()
+        expected = []
+        for i, amount, op in RECORDS:
+            account = expected_accounts[i]
+            expected.append(account.deposit(amount) if op == OP_DEPOSIT else account.withdraw(amount))
+
+        accounts = make_accounts()
+        idx, amounts, ops = zip(*RECORDS)
+        applied = TransactionManager().execute_batch(accounts, idx, amounts, ops)
+
+        self.assertEqual(applied.tolist(), expected)
+        self.assertEqual([a.get_balance() for a in accounts],
+                         [a.get_balance() for a in expected_accounts])
+
+    def test_jit_and_python_kernels_agree(self):
+        kernel = banking_core._jit_apply_batch
+        python_kernel = getattr(kernel, "py_func", kernel)
+        idx = np.array([r[0] for r in RECORDS], dtype=np.int64)
+        amounts = np.array([round(r[1] * 100) for r in RECORDS], dtype=np.int64)
+        ops = np.array([r[2] for r in RECORDS], dtype=np.int8)
+        balances = np.array([10000, 1000, 0], dtype=np.int64)
+        python_balances = balances.copy()
+
+        applied = banking_core._apply_batch(balances, idx, amounts, ops)
+        python_applied = python_kernel(python_balances, idx, amounts, ops)
+
+        self.assertEqual(applied.tolist(), python_applied.tolist())
+        self.assertEqual(balances.tolist(), python_balances.tolist())
+
+    def test_notifies_observers_of_applied_records(self):
+        accounts = make_accounts()
+        observer = RecordingObserver()
+        accounts[1].attach(observer)
+        TransactionManager().execute_batch(accounts, [1, 1], [100.0, 5.25], [OP_WITHDRAW, OP_WITHDRAW])
+        self.assertEqual(observer.messages, ["Withdrawal of $5.25 made."])
+
+    def test_negative_index_counts_from_the_end(self):
+        accounts = make_accounts()
+        TransactionManager().execute_batch(accounts, [-1], [1.0], [OP_DEPOSIT])
+        self.assertEqual(accounts[2].get_balance_cents(), 100)
+
+    def test_out_of_range_index_is_rejected_before_any_update(self):
+        accounts = make_accounts()
+        manager = TransactionManager()
+        for idx in ([0, 3], [-4]):
+            with self.assertRaises(IndexError):
+                manager.execute_batch(accounts, idx, [1.0] * len(idx), [OP_DEPOSIT] * len(idx))
+        self.assertEqual([a.get_balance_cents() for a in accounts], [10000, 1000, 0])
+
+    def test_repeated_account_keeps_every_update(self):
+        account = SavingsAccount("S1", 10.0)
+        applied = TransactionManager().execute_batch(
+            [account, account], [0, 1], [5.0, 1.0], [OP_DEPOSIT, OP_DEPOSIT])
+        self.assertEqual(applied.tolist(), [True, True])
+        self.assertEqual(account.get_balance_cents(), 1600)
+
+    def test_unknown_opcode_is_rejected(self):
+        accounts = make_accounts()
+        with self.assertRaises(ValueError):
+            TransactionManager().execute_batch(accounts, [0], [1.0], [2])
+        self.assertEqual(accounts[0].get_balance_cents(), 10000)
+
+    def test_mismatched_lengths_are_rejected(self):
+        with self.assertRaises(ValueError):
+            TransactionManager().execute_batch(make_accounts(), [0, 1], [1.0], [OP_DEPOSIT, OP_DEPOSIT])
+
+
+
+class CommandPoolTest(BankingTestCase):
+    def test_acquire_reuses_released_command(self):
+        command = DepositCommand.acquire(None, 1.0)
+        command.release()
+        self.assertIs(DepositCommand.acquire(None, 2.0), command)
+
+    def test_release_rejects_double_release(self):
+        command = WithdrawCommand.acquire(None, 1.0)
+        command.release()
+        with self.assertRaises(ValueError):
+            command.release()
+        self.assertEqual(WithdrawCommand._pool.count(command), 1)
+
+    def test_release_rejects_caller_owned_command(self):
+        size = len(DepositCommand._pool)
+        with self.assertRaises(ValueError):
+            DepositCommand(None, 1.0).release()
+        self.assertEqual(len(DepositCommand._pool), size)
+
+    def test_undo_leaves_caller_owned_command_out_of_the_pool(self):
+        account = SavingsAccount("S1", 100.0)
+        command = WithdrawCommand(account, 10.0)
+        manager = TransactionManager()
+        for _ in range(2):
+            manager.execute_transaction(command)
+        while manager.undo_last_transaction():
+            pass
+        self.assertNotIn(command, WithdrawCommand._pool)
+        self.assertEqual(account.get_balance_cents(), 10000)
+
+
+
+class CustomerTest(BankingTestCase):
+    def test_renamed_customer_uses_new_name(self):
+        customer = Customer("Alice")
+        account = SavingsAccount("S1", 10.0)
+        account.attach(customer)
+        customer.name = "Carol"
+        account.deposit(1.0)
+        self.assertEqual(customer.name, "Carol")
+        self.assertIn("[Customer Carol Notification]", self.output.getvalue())
+
+
+class OnePercent(InterestStrategy):
+    """User strategy written against the float get_balance() contract."""
+    def calculate(self, account):
+        account.deposit(account.get_balance() * 0.01)
+
+
+class MoneyTest(BankingTestCase):
+    def test_get_balance_stays_float_compatible(self):
+        account = SavingsAccount("S1", 100.0, OnePercent())
+        account.calculate_interest()
+        self.assertEqual(account.get_balance(), 101.0)
+        self.assertEqual(str(account.get_balance_decimal()), "101.00")
+
+    def test_money_formats_like_baseline(self):
+        for cents in (0, 5, 100, 12345, -5, -505, -100):
+            self.assertEqual(banking_core._money(cents), "${:.2f}".format(cents / 100))
+
+    def test_negative_balance_is_logged_correctly(self):
+        CurrentAccount("C", -10.05).deposit(5)
+        self.assertIn("New balance: $-5.05", self.output.getvalue())
+
+
+@unittest.skipIf(np is None, "batch paths need NumPy")
+class InterestBatchTest(BankingTestCase):
+    def test_batch_matches_per_account_calculate(self):
+        def make():
+            return [
+                SavingsAccount("S1", 123.45, SavingsInterest()),
+                CurrentAccount("C1", 600.0, CurrentInterest()),
+                CurrentAccount("C2", 400.0, CurrentInterest()),
+                SavingsAccount("S2", 50.0),
+            ]
+        expected = make()
+        for account in expected:
+            account.calculate_interest()
+        accounts = make()
+        interest = calculate_interest_batch(accounts)
+
+        self.assertEqual(interest.tolist(), [370, 300, 0, 0])
+        self.assertEqual([a.get_balance_cents() for a in accounts],
+                         [a.get_balance_cents() for a in expected])
+
+    def test_user_strategy_goes_through_calculate_interest(self):
+        accounts = [SavingsAccount("S1", 100.0, OnePercent()), SavingsAccount("S2", 100.0, SavingsInterest())]
+        interest = calculate_interest_batch(accounts)
+        self.assertEqual(interest.tolist(), [100, 300])
+        self.assertEqual([a.get_balance_cents() for a in accounts], [10100, 10300])
+
+    def test_strategy_accepts_cent_arrays(self):
+        balances = np.array([12345, 100], dtype=np.int64)
+        self.assertEqual(SavingsInterest().calculate(balances).tolist(), [370, 3])
+        self.assertEqual(balances.tolist(), [12715, 103])
+
+    def test_invalid_type_codes_are_rejected(self):
+        balances = np.array([100000] * 3, dtype=np.int64)
+        with self.assertRaises(IndexError):
+            apply_interest(balances, np.array([0, 1, 7], dtype=np.int8))
+        with self.assertRaises(IndexError):
+            apply_interest(balances, -1)
+        with self.assertRaises(ValueError):
+            apply_interest(balances, np.array([0, 1], dtype=np.int8))
+        self.assertEqual(balances.tolist(), [100000] * 3)
+
+    def test_float_arrays_are_rejected(self):
+        with self.assertRaises(TypeError):
+            SavingsInterest().calculate(np.array([123.45]))
+
+
+class AotKernelTest(unittest.TestCase):
+    def fake_build(self, **attrs):
+        return types.SimpleNamespace(apply_batch="batch", apply_interest="interest", **attrs)
+
+    def test_matching_build_is_used(self):
+        abi = banking_core.kernel_abi()
+        module = self.fake_build(kernel_abi=lambda: abi)
+        self.assertEqual(banking_core._aot_kernels(module), ("batch", "interest"))
+
+    def test_stale_or_unversioned_build_is_ignored(self):
+        for module in (self.fake_build(kernel_abi=lambda: 0), self.fake_build()):
+            with self.assertWarns(RuntimeWarning):
+                self.assertIsNone(banking_core._aot_kernels(module))
+
+
+class Fee(Command):
+    """User-defined command without an opcode."""
+    def __init__(self, account):
+        self.account = account
+
+    def execute(self):
+        return self.account.withdraw(1.0)
+
+    def undo(self):
+        return self.account.deposit(1.0)
+
+
+class TransactionHistoryTest(BankingTestCase):
+    def test_custom_command_is_recorded_and_undone(self):
+        account = SavingsAccount("S1", 10.0)
+        manager = TransactionManager()
+        self.assertTrue(manager.execute_transaction(Fee(account)))
+        self.assertEqual(account.get_balance_cents(), 900)
+        self.assertTrue(manager.undo_last_transaction())
+        self.assertEqual(account.get_balance_cents(), 1000)
+
+    def test_execute_many_accepts_custom_commands(self):
+        account = SavingsAccount("S1", 10.0)
+        manager = TransactionManager()
+        results = manager.execute_many([DepositCommand(account, 5.0), Fee(account)])
+        self.assertEqual(results, [True, True])
+        while manager.undo_last_transaction():
+            pass
+        self.assertEqual(account.get_balance_cents(), 1000)
+
+    def test_execute_many_defers_notifications_in_order(self):
+        first, second = SavingsAccount("S1", 10.0), SavingsAccount("S2", 10.0)
+        seen = []
+
+        class BalanceObserver:
+            def update(self, message):
+                seen.append((message, first.get_balance_cents(), second.get_balance_cents()))
+
+        observer = BalanceObserver()
+        first.attach(observer)
+        second.attach(observer)
+
+        TransactionManager().execute_many(
+            [DepositCommand(first, 1.0), WithdrawCommand(second, 2.0)])
+
+        self.assertEqual(seen, [
+            ("Deposit of $1.00 made.", 1100, 800),
+            ("Withdrawal of $2.00 made.", 1100, 800),
+        ])
+
+    def test_execute_many_delivers_notifications_when_a_command_raises(self):
+        account = SavingsAccount("S1", 10.0)
+        observer = RecordingObserver()
+        account.attach(observer)
+
+        class Broken(Command):
+            def execute(self):
+                raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            TransactionManager().execute_many([DepositCommand(account, 5.0), Broken()])
+        self.assertEqual(observer.messages, ["Deposit of $5.00 made."])
+        self.assertIsNone(account._pending)
+
+    def test_execute_op_matches_commands(self):
+        account = SavingsAccount("S1", 10.0)
+        manager = TransactionManager()
+        self.assertTrue(manager.execute_op(OP_DEPOSIT, account, 2.5))
+        self.assertFalse(manager.execute_op(OP_WITHDRAW, account, 100.0))
+        self.assertTrue(manager.undo_last_transaction())
+        self.assertFalse(manager.undo_last_transaction())
+        self.assertEqual(account.get_balance_cents(), 1000)
+
+    def test_history_keeps_only_the_last_max_history_entries(self):
+        account = SavingsAccount("S1", 0)
+        manager = TransactionManager(max_history=3)
+        for _ in range(10):
+            manager.execute_op(OP_DEPOSIT, account, 1.0)
+        undone = 0
+        while manager.undo_last_transaction():
+            undone += 1
+        self.assertEqual(undone, 3)
+        self.assertEqual(account.get_balance_cents(), 700)
+
+    def test_max_history_none_is_unbounded(self):
+        account = SavingsAccount("S1", 0)
+        manager = TransactionManager(max_history=None)
+        for _ in range(2000):
+            manager.execute_op(OP_DEPOSIT, account, 1.0)
+        undone = 0
+        while manager.undo_last_transaction():
+            undone += 1
+        self.assertEqual(undone, 2000)
+
+    def test_negative_max_history_is_rejected(self):
+        with self.assertRaises(ValueError):
+            TransactionManager(max_history=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()